@@ -1,6 +1,6 @@
 # /// script
 # requires-python = ">=3.12"
-# dependencies = ["starlette", "uvicorn"]
+# dependencies = ["starlette", "uvicorn[standard]", "numpy", "httpx[http2]", "orjson"]
 # ///
 """ElevenLabs V3 TTS HTTP Daemon for Claude Code.
 
@@ -28,43 +28,54 @@ Endpoints:
 """
 
 import asyncio
+import base64
 import collections
+import hashlib
+import heapq
+import itertools
 import json
 import logging
 import os
+import select
 
 log = logging.getLogger("voice-daemon")
-import re
 import shutil
-import struct
-import subprocess
+import signal
 import sys
 import tempfile
 import time
-import uuid
 from dataclasses import dataclass, field
 from pathlib import Path
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
+import httpx
+import numpy as np
+import orjson
 from starlette.applications import Starlette
 from starlette.middleware import Middleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request as StarletteRequest
-from starlette.responses import HTMLResponse, FileResponse, JSONResponse, StreamingResponse
+from starlette.responses import FileResponse, HTMLResponse, JSONResponse, Response, StreamingResponse
 from starlette.routing import Route
 import uvicorn
 
+try:
+    import uvloop  # libuv event loop, installed with uvicorn[standard]
+except ImportError:
+    uvloop = None
+
+_LOCAL_ORIGINS = frozenset(("http://127.0.0.1", "http://localhost", "http://[::1]"))
+_LOCAL_ORIGIN_PORT_PREFIXES = tuple(f"{origin}:" for origin in _LOCAL_ORIGINS)
+
+
 def _is_local_origin(origin: str) -> bool:
     if not origin:
         return True  # No Origin header = non-browser (curl, etc.)
     if origin == "null":
         return False  # Sandboxed iframes send "null" — reject
     origin = origin.rstrip("/")
-    for prefix in ("http://127.0.0.1", "http://localhost", "http://[::1]"):
-        if origin == prefix or origin.startswith(prefix + ":"):
-            return True
-    return False
+    return origin in _LOCAL_ORIGINS or origin.startswith(_LOCAL_ORIGIN_PORT_PREFIXES)
 
 
 class LocalhostGuardMiddleware(BaseHTTPMiddleware):
@@ -72,9 +83,10 @@ class LocalhostGuardMiddleware(BaseHTTPMiddleware):
         if request.method == "POST":
             origin = request.headers.get("origin", "")
             if origin and not _is_local_origin(origin):
-                return JSONResponse({"error": "Forbidden origin"}, status_code=403)
+                return _ERR_FORBIDDEN_ORIGIN
         return await call_next(request)
 
+
 # --- Config ---
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
@@ -84,10 +96,16 @@ DEFAULT_MODEL = "eleven_v3"
 DEFAULT_FORMAT = "mp3_44100_128"
 TEMP_PREFIX = "claude-tts-"
 DASHBOARD_DIR = REPO_ROOT / "dashboard"
+INDEX_PATH = DASHBOARD_DIR / "index.html"
+PORTRAITS_ROOT = (DASHBOARD_DIR / "portraits").resolve()
+VOICES_PATH = REPO_ROOT / "voices.json"
 FFMPEG = (
     shutil.which("ffmpeg")
     or next((p for p in ("/opt/homebrew/bin/ffmpeg", "/usr/local/bin/ffmpeg") if Path(p).exists()), "ffmpeg")
 )
+# Resolved once so each playback spawn execs an absolute path instead of scanning PATH
+AFPLAY = shutil.which("afplay") or "afplay"
+METRICS_LOG_EVERY = 1000  # Access log is off; one summary line per this many requests
 
 
 def _load_dotenv():
@@ -108,15 +126,19 @@ _load_dotenv()
 
 DASHBOARD_PORT = int(os.environ.get("SPEAK_PORT", "7865"))
 CACHE_DIR = Path(os.environ.get("SPEAK_CACHE_DIR", str(REPO_ROOT / "cache")))
+TTS_CACHE_DIR = CACHE_DIR / "tts"
+TTS_CACHE_MAX_AGE_HOURS = 24 * 7
+# Start playback on a partially downloaded file instead of waiting for the whole clip
+SPEAK_STREAMING = os.environ.get("SPEAK_STREAMING") == "1"
+STREAM_START_BYTES = 64 * 1024
 
 
 def _load_voices() -> tuple[dict[str, str], dict[str, str]]:
-    voices_path = REPO_ROOT / "voices.json"
     roster: dict[str, str] = {}
     by_name: dict[str, str] = {}
-    if voices_path.exists():
+    if VOICES_PATH.exists():
         try:
-            entries = json.loads(voices_path.read_text())
+            entries = json.loads(VOICES_PATH.read_text())
             if not isinstance(entries, list):
                 log.warning("voices.json is not a list")
                 return roster, by_name
@@ -165,22 +187,26 @@ def _fetch_voices_from_api() -> dict[str, str]:
 def resolve_voice(voice: str | None) -> str:
     if not voice:
         return os.environ.get("ELEVENLABS_VOICE_ID", "")
-    if voice.lower() in VOICE_BY_NAME:
-        return VOICE_BY_NAME[voice.lower()]
-    if _api_voices_cache is not None and voice.lower() in _api_voices_cache:
-        return _api_voices_cache[voice.lower()]
+    name = voice.lower()
+    if hit := VOICE_BY_NAME.get(name):
+        return hit
+    if _api_voices_cache is not None and (hit := _api_voices_cache.get(name)):
+        return hit
     return voice
 
 
 async def resolve_voice_async(voice: str | None) -> str:
     if not voice:
         return os.environ.get("ELEVENLABS_VOICE_ID", "")
-    if voice.lower() in VOICE_BY_NAME:
-        return VOICE_BY_NAME[voice.lower()]
-    api_voices = await asyncio.to_thread(_fetch_voices_from_api)
-    if voice.lower() in api_voices:
-        return api_voices[voice.lower()]
-    return voice
+    name = voice.lower()
+    if hit := VOICE_BY_NAME.get(name):
+        return hit
+    # The API roster is fetched at most once; after that, misses (raw voice IDs,
+    # unknown names) resolve without another thread hop
+    api_voices = _api_voices_cache
+    if api_voices is None:
+        api_voices = await asyncio.to_thread(_fetch_voices_from_api)
+    return api_voices.get(name) or voice
 
 
 def voice_label(voice_id: str) -> str:
@@ -190,91 +216,407 @@ def voice_label(voice_id: str) -> str:
 # --- SSE Broadcaster ---
 
 MAX_SSE_QUEUE = 256
+MAX_SSE_DROPS = 2  # Consecutive overflowing sends before a subscriber is disconnected
+SSE_COALESCE_INTERVAL = 1 / 30  # Cap on voice_active updates during rapid seeks
 MAX_TEXT_LENGTH = 10000
 MAX_HISTORY = 1000
+MAX_PREALLOC_BODY = 1 << 20  # Don't trust a larger Content-Length for an up-front allocation
+
+
+# Entry IDs: a per-boot nonce (history IDs name cache files that outlive a restart)
+# plus a counter, instead of urandom per request
+_ID_NONCE = os.urandom(4).hex()
+_id_counter = itertools.count(1)
+
+
+def _new_id() -> str:
+    return f"{_ID_NONCE}{next(_id_counter):08x}"
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson: compact output, several times faster than json."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+def _error_response(message: str, status_code: int) -> Response:
+    """A fixed JSON error, serialized once at import and returned as-is per request."""
+    return Response(orjson.dumps({"error": message}), status_code=status_code, media_type="application/json")
+
+
+_ERR_INVALID_JSON = _error_response("Invalid JSON", 400)
+_ERR_EXPECTED_OBJECT = _error_response("Expected JSON object", 400)
+_ERR_CHANNEL_TYPE = _error_response("Channel must be a string", 400)
+_ERR_NO_API_KEY = _error_response("ELEVENLABS_API_KEY not set", 500)
+_ERR_FORBIDDEN_ORIGIN = _error_response("Forbidden origin", 403)
 
 
 class SSEBroadcaster:
     def __init__(self):
-        self._clients: list[asyncio.Queue] = []
+        # Subscriber queue -> consecutive sends that found it full
+        self._clients: dict[asyncio.Queue, int] = {}
+        self._pending: dict[str, dict] = {}  # Coalesced events awaiting the next flush
+        self._flush_task: asyncio.Task | None = None
+        self._last_flush = 0.0
+        # Rendered initial "state" frame for new subscribers; None when stale
+        self._state_snapshot: bytes | None = None
 
     def subscribe(self) -> asyncio.Queue:
         q: asyncio.Queue = asyncio.Queue(maxsize=MAX_SSE_QUEUE)
-        self._clients.append(q)
+        self._clients[q] = 0
         return q
 
     def unsubscribe(self, q: asyncio.Queue):
-        try:
-            self._clients.remove(q)
-        except ValueError:
-            pass
+        self._clients.pop(q, None)
 
     async def send(self, event: str, data: dict):
-        msg = f"event: {event}\ndata: {json.dumps(data)}\n\n"
-        dead: list[asyncio.Queue] = []
-        for q in list(self._clients):
-            try:
-                q.put_nowait(msg)
-            except asyncio.QueueFull:
-                dead.append(q)
-        for q in dead:
-            try:
-                self._clients.remove(q)
-            except ValueError:
-                pass
+        self.send_frame(event, _sse_frame(event, data))
+
+    def send_frame(self, event: str, frame: bytes):
+        """Fan out an already-encoded SSE frame. Supersedes any coalesced event of the same name."""
+        self._pending.pop(event, None)
+        self._state_snapshot = None
+        supersedes = event == "voice_active"
+        for q in tuple(self._clients):
+            if q.full():
+                # Slow consumer: rather than grow or block, drop its oldest frame if that's
+                # a voice_active this one replaces. Losing any other frame would leave it
+                # silently stale, so instead (or if it stays full) end its stream (None)
+                # and the browser reconnects and resyncs from the state snapshot.
+                dropped = q.get_nowait()
+                self._clients[q] += 1
+                if (not supersedes or not dropped.startswith(_VOICE_ACTIVE_PREFIX)
+                        or self._clients[q] >= MAX_SSE_DROPS):
+                    del self._clients[q]
+                    q.put_nowait(None)
+                    continue
+            else:
+                self._clients[q] = 0
+            q.put_nowait(frame)
+
+    def invalidate_state(self):
+        """Mark the cached state snapshot stale after a change that isn't broadcast."""
+        self._state_snapshot = None
+
+    def state_snapshot(self, queue: "AudioQueue") -> bytes:
+        """The "state" frame every new subscriber starts with, rendered once per change
+        rather than once per connection."""
+        if self._state_snapshot is None:
+            state = queue.status()
+            state["recent_history"] = queue.get_history(limit=20)
+            self._state_snapshot = _sse_frame("state", state)
+        return self._state_snapshot
+
+    async def send_coalesced(self, event: str, data: dict):
+        """Send a state-replacing event at most once per SSE_COALESCE_INTERVAL.
+        The first of a burst goes out immediately; the rest collapse into the latest."""
+        if self._flush_task is None and time.monotonic() - self._last_flush >= SSE_COALESCE_INTERVAL:
+            self._last_flush = time.monotonic()
+            await self.send(event, data)
+            return
+        self._pending[event] = data
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_pending())
+
+    async def _flush_pending(self):
+        await asyncio.sleep(max(0.0, self._last_flush + SSE_COALESCE_INTERVAL - time.monotonic()))
+        self._flush_task = None
+        self._last_flush = time.monotonic()
+        pending, self._pending = self._pending, {}
+        for event, data in pending.items():
+            await self.send(event, data)
 
 
-# --- Audio Duration ---
+_VOICE_ACTIVE_PREFIX = b"event: voice_active\n"
 
-def _get_audio_duration(path: str) -> float | None:
+
+def _sse_frame(event: str, data: dict) -> bytes:
+    """Encode an SSE frame once, as compact JSON, for every subscriber to share."""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+def _idle_event(queued: int) -> dict:
+    return {
+        "id": None, "voice": None, "type": "idle",
+        "text": None, "duration": None, "segments": None,
+        "queued": queued,
+        "channel": None, "priority": False,
+    }
+
+
+# The worker goes idle with an empty queue after nearly every clip
+_IDLE_FRAME = _sse_frame("voice_active", _idle_event(0))
+
+
+# --- Audio Probing & Trimming ---
+
+# MPEG audio Layer III tables, indexed by the frame header's bitrate/sample-rate fields
+_MP3_BITRATES = {
+    1: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),  # MPEG-1
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),       # MPEG-2/2.5
+}
+_MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+
+def _id3v2_size(head: bytes) -> int:
+    """Bytes taken by a leading ID3v2 tag (0 if none), given the file's first 10 bytes."""
+    if head[:3] != b"ID3" or len(head) < 10:
+        return 0
+    size = 10 + ((head[6] & 0x7F) << 21 | (head[7] & 0x7F) << 14
+                 | (head[8] & 0x7F) << 7 | (head[9] & 0x7F))
+    if head[5] & 0x10:
+        size += 10  # ID3v2.4 footer
+    return size
+
+
+def _mp3_frame_header(header: bytes) -> tuple[int, int, int, int] | None:
+    """(frame_length, samples_per_frame, sample_rate, bitrate) of a Layer III frame header."""
+    if len(header) < 4 or header[0] != 0xFF or (header[1] & 0xE0) != 0xE0:
+        return None
+    version = (header[1] >> 3) & 0x03
+    layer = (header[1] >> 1) & 0x03
+    bitrate_idx = header[2] >> 4
+    rate_idx = (header[2] >> 2) & 0x03
+    if version == 1 or layer != 1 or bitrate_idx in (0, 15) or rate_idx == 3:
+        return None  # Reserved, not Layer III, or free-format
+    mpeg1 = version == 3
+    sample_rate = _MP3_SAMPLE_RATES[version][rate_idx]
+    bitrate = _MP3_BITRATES[1 if mpeg1 else 2][bitrate_idx] * 1000
+    samples = 1152 if mpeg1 else 576
+    padding = (header[2] >> 1) & 0x01
+    return samples // 8 * bitrate // sample_rate + padding, samples, sample_rate, bitrate
+
+
+def _mp3_duration_from_header(path: str) -> float | None:
+    """Duration from the first MPEG frame's Xing/Info frame count when present (VBR),
+    otherwise from the frame headers themselves (see _mp3_walk_duration)."""
     try:
-        result = subprocess.run(
-            ["afinfo", path],
-            capture_output=True, text=True, timeout=5,
-        )
-        m = re.search(r"estimated duration:\s*([\d.]+)", result.stdout)
-        if m:
-            return float(m.group(1))
-    except Exception:
-        pass
-    return None
+        with open(path, "rb") as f:
+            start = _id3v2_size(f.read(10))
+            f.seek(start)
+            frame = f.read(192)
+            info = _mp3_frame_header(frame)
+            if info is None:
+                return None
+            _, samples, sample_rate, _ = info
+            mono = (frame[3] >> 6) == 3
+            side_info = (17 if mono else 32) if samples == 1152 else (9 if mono else 17)
+            xing = 4 + side_info
+            if frame[xing:xing + 4] in (b"Xing", b"Info") and frame[xing + 7] & 0x01:
+                frames = int.from_bytes(frame[xing + 8:xing + 12], "big")
+                return frames * samples / sample_rate
+            f.seek(start)
+            return _mp3_walk_duration(f.read())
+    except OSError:
+        return None
 
 
-def _extract_envelope(path: str, chunk_ms: int = 50) -> list[float]:
+def _mp3_walk_duration(data: bytes) -> float | None:
+    """Duration of a tagless MPEG stream: size over bitrate if the first 10 frames
+    share one bitrate (CBR), otherwise the sum of every frame's duration (VBR)."""
+    pos = 0
+    frames = 0
+    total = 0.0
+    bitrates: set[int] = set()
+    while (info := _mp3_frame_header(data[pos:pos + 4])) is not None:
+        frame_length, samples, sample_rate, bitrate = info
+        if frames < 10:
+            bitrates.add(bitrate)
+        elif frames == 10 and len(bitrates) == 1:
+            return len(data) * 8 / bitrate
+        total += samples / sample_rate
+        pos += frame_length
+        frames += 1
+    return total if frames else None
+
+
+MAX_CONCURRENT_PROBES = min(4, os.cpu_count() or 1)
+ENVELOPE_SAMPLE_RATE = 8000  # Plenty for a 20 Hz lip-sync envelope
+
+# Bounds background prefetches only; seek and stream-segment probes never queue behind them
+_probe_slots = asyncio.Semaphore(MAX_CONCURRENT_PROBES)
+
+
+def _window_rms(pcm: np.ndarray, samples_per_chunk: int) -> np.ndarray:
+    """Per-window RMS of int16 PCM, scaled to 0..1. Trailing partial window is dropped."""
+    n_chunks = len(pcm) // samples_per_chunk
+    pcm = pcm[:n_chunks * samples_per_chunk].reshape(n_chunks, samples_per_chunk)
+    # Row-wise sum of squares in one pass, without materializing the squared block
+    sq_sum = np.einsum("ij,ij->i", pcm, pcm, dtype=np.float32)
+    return np.sqrt(sq_sum / samples_per_chunk, dtype=np.float64) / 32768.0
+
+
+async def _probe_and_envelope(path: str, chunk_ms: int = 50,
+                              background: bool = False) -> tuple[float | None, str]:
+    """Duration and lip-sync envelope of an audio file, the envelope as base64 of its
+    uint8 levels (0-255 per chunk): a third of the JSON float list on the wire."""
+    duration, levels = await _probe_audio(path, chunk_ms, background)
+    return duration, base64.b64encode(levels).decode("ascii")
+
+
+async def _probe_audio(path: str, chunk_ms: int = 50,
+                       background: bool = False) -> tuple[float | None, bytes]:
+    """Duration and uint8-quantized envelope of an audio file from a single ffmpeg pass."""
+    if background:
+        async with _probe_slots:
+            duration, levels = await _stream_probe(path, chunk_ms)
+    else:
+        duration, levels = await _stream_probe(path, chunk_ms)
+    if duration is None:
+        duration = _mp3_duration_from_header(path)
+    return duration, levels
+
+
+async def _stream_probe(path: str, chunk_ms: int) -> tuple[float | None, bytes]:
+    """Decode once with ffmpeg, reducing the PCM stream to an RMS envelope as it
+    arrives; the duration is the decoded sample count."""
+    samples_per_chunk = ENVELOPE_SAMPLE_RATE * chunk_ms // 1000
+    bytes_per_chunk = samples_per_chunk * 2
     try:
-        result = subprocess.run(
-            [FFMPEG, "-i", path, "-f", "s16le", "-ac", "1", "-ar", "16000",
-             "-acodec", "pcm_s16le", "-loglevel", "error", "-"],
-            capture_output=True, timeout=30,
+        proc = await asyncio.create_subprocess_exec(
+            FFMPEG, "-i", path,
+            # Short resampling filter: an RMS envelope doesn't need anti-aliasing quality
+            "-af", f"aresample={ENVELOPE_SAMPLE_RATE}:filter_size=1:phase_shift=0",
+            "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-loglevel", "error", "-",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
         )
-        raw = result.stdout
+    except OSError:
+        return None, b""
+    windows: list[np.ndarray] = []
+    pending = bytearray()
+    total_bytes = 0
+    try:
+        async with asyncio.timeout(30):
+            while data := await proc.stdout.read(bytes_per_chunk * 8):
+                total_bytes += len(data)
+                pending += data
+                usable = len(pending) - len(pending) % bytes_per_chunk
+                if usable:
+                    # Zero-copy view; dropped before the bytearray is resized
+                    pcm = np.frombuffer(pending, dtype="<i2", count=usable // 2)
+                    windows.append(_window_rms(pcm, samples_per_chunk))
+                    del pcm
+                    del pending[:usable]
+            await proc.wait()
     except Exception:
-        return []
-    if not raw:
-        return []
-    samples_per_chunk = 16000 * chunk_ms // 1000
-    bytes_per_chunk = samples_per_chunk * 2
-    envelope = []
-    for i in range(0, len(raw) - 1, bytes_per_chunk):
-        chunk = raw[i:i + bytes_per_chunk]
-        n = len(chunk) // 2
-        if n == 0:
-            break
-        vals = struct.unpack(f'<{n}h', chunk[:n * 2])
-        rms = (sum(v * v for v in vals) / n) ** 0.5 / 32768.0
-        envelope.append(rms)
-    if envelope:
-        p95 = sorted(envelope)[int(len(envelope) * 0.95)] or 0.001
-        envelope = [round(min(v / p95, 1.0), 3) for v in envelope]
-    return envelope
-
-
-# --- ElevenLabs API (sync, run via asyncio.to_thread) ---
+        return None, b""
+    finally:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+    if not windows:
+        return None, b""
+    return total_bytes / 2 / ENVELOPE_SAMPLE_RATE, _quantize_envelope(np.concatenate(windows))
+
+
+def _quantize_envelope(rms: np.ndarray) -> bytes:
+    """Normalize an RMS envelope to its 95th percentile and quantize to uint8."""
+    k = int(len(rms) * 0.95)
+    p95 = float(np.partition(rms, k)[k]) or 1e-3
+    # Normalize and quantize in place: one buffer for the whole chain
+    np.multiply(rms, 255.0 / p95, out=rms)
+    np.minimum(rms, 255.0, out=rms)
+    return rms.round(out=rms).astype(np.uint8).tobytes()
+
+
+# Whole MP3 frames from byte start copied to their own file: (path, end offset, seconds)
+def _cut_mp3_segment(path: str, start: int) -> tuple[str, int, float] | None:
+    try:
+        with open(path, "rb") as f:
+            f.seek(start)
+            data = f.read()
+    except OSError:
+        return None
+    pos = _id3v2_size(data[:10]) if start == 0 else 0
+    begin = pos
+    seconds = 0.0
+    while (info := _mp3_frame_header(data[pos:pos + 4])) is not None and pos + info[0] <= len(data):
+        frame_length, samples, sample_rate, _ = info
+        seconds += samples / sample_rate
+        pos += frame_length
+    if pos == begin:
+        return None
+    fd, tmp = tempfile.mkstemp(prefix=TEMP_PREFIX, suffix=".mp3")
+    with os.fdopen(fd, "wb") as f:
+        f.write(memoryview(data)[begin:pos])
+    return tmp, start + pos, seconds
+
+
+def _trim_mp3_frames(path: str, offset_seconds: float) -> str | None:
+    """Cut an MP3 at the first frame boundary at or after the offset by walking frame
+    headers and copying the remaining bytes. None if the stream can't be walked."""
+    try:
+        data = Path(path).read_bytes()
+    except OSError:
+        return None
+    pos = _id3v2_size(data[:10])
+    elapsed = 0.0
+    while elapsed < offset_seconds:
+        info = _mp3_frame_header(data[pos:pos + 4])
+        if info is None:
+            return None  # Lost sync (or ran past the end)
+        frame_length, samples, sample_rate, _ = info
+        elapsed += samples / sample_rate
+        pos += frame_length
+    fd, tmp = tempfile.mkstemp(prefix=TEMP_PREFIX, suffix=".mp3")
+    with os.fdopen(fd, "wb") as f:
+        f.write(memoryview(data)[pos:])
+    return tmp
+
+
+async def _trim_audio(path: str, offset_seconds: float) -> str:
+    """Path to a copy of the audio starting at the offset, or the original path
+    itself when the offset is too small to be worth cutting."""
+    if offset_seconds < 0.05:
+        return path
+    # In-process frame cut first; ffmpeg (~40 ms of process startup) only as a fallback
+    tmp = await asyncio.to_thread(_trim_mp3_frames, path, offset_seconds)
+    if tmp:
+        return tmp
+    # Same container as the source, since a stream copy can't change it
+    fd, tmp = tempfile.mkstemp(prefix=TEMP_PREFIX, suffix=Path(path).suffix or ".mp3")
+    os.close(fd)
+    # Stream copy from the input-side seek: no decode/re-encode. Timestamps are
+    # rebased to zero so the player doesn't see a leading gap.
+    proc = await asyncio.create_subprocess_exec(
+        FFMPEG, "-ss", str(offset_seconds), "-i", path,
+        "-map", "0:a", "-c", "copy", "-avoid_negative_ts", "make_zero", "-y", tmp,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    if await proc.wait() != 0:
+        log.warning(f"ffmpeg trim failed (rc={proc.returncode}); playing from the start")
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        return path
+    return tmp
+
+
+# --- ElevenLabs API ---
+
+_http: httpx.AsyncClient | None = None
+
 
 def _api_key() -> str:
     return os.environ.get("ELEVENLABS_API_KEY", "")
 
 
+def _http_client() -> httpx.AsyncClient:
+    """Shared keep-alive client so TLS setup is paid once per session."""
+    global _http
+    if _http is None:
+        _http = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(120, connect=10),
+            limits=httpx.Limits(max_keepalive_connections=4),
+        )
+    return _http
+
+
 def _validate_mp3(data: bytes) -> bool:
     if len(data) < 4:
         return False
@@ -285,49 +627,219 @@ def _validate_mp3(data: bytes) -> bool:
     return False
 
 
-def _fetch_tts(text: str, voice_id: str, retries: int = 2) -> str:
+def _tts_cache_slot(*parts: str) -> Path:
+    key = hashlib.sha256("|".join(parts).encode()).hexdigest()
+    return TTS_CACHE_DIR / f"{key}.mp3"
+
+
+def _copy_to_temp(src: Path) -> str:
+    fd, path = tempfile.mkstemp(prefix=TEMP_PREFIX, suffix=".mp3")
+    os.close(fd)
+    shutil.copyfile(src, path)  # Not copy2: an old slot mtime would age out the copy
+    return path
+
+
+def _cached_tts(slot: Path) -> str | None:
+    """Copy a fresh cache slot to a temp file, or None on miss/expiry."""
+    try:
+        if time.time() - slot.stat().st_mtime > TTS_CACHE_MAX_AGE_HOURS * 3600:
+            return None
+        return _copy_to_temp(slot)
+    except OSError:
+        return None
+
+
+def _store_tts(data: bytes, slot: Path | None) -> str:
+    """Atomically publish audio into its cache slot, then hand out a temp copy."""
+    if slot is not None:
+        try:
+            slot.parent.mkdir(parents=True, exist_ok=True)
+            fd, partial = tempfile.mkstemp(dir=slot.parent, suffix=".part")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(partial, slot)
+            return _copy_to_temp(slot)
+        except OSError as e:
+            log.warning(f"TTS cache write failed: {e}")
+    fd, path = tempfile.mkstemp(prefix=TEMP_PREFIX, suffix=".mp3")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    return path
+
+
+def _publish_to_cache(path: str, slot: Path):
+    """Atomically copy a finished download into its cache slot."""
+    try:
+        slot.parent.mkdir(parents=True, exist_ok=True)
+        fd, partial = tempfile.mkstemp(dir=slot.parent, suffix=".part")
+        os.close(fd)
+        shutil.copyfile(path, partial)
+        os.replace(partial, slot)
+    except OSError as e:
+        log.warning(f"TTS cache write failed: {e}")
+
+
+async def _fetch_tts(text: str, voice_id: str, retries: int = 2, use_cache: bool = True) -> str:
+    slot = _tts_cache_slot(voice_id, DEFAULT_MODEL, DEFAULT_FORMAT, text) if use_cache else None
+    if slot is not None and (path := await asyncio.to_thread(_cached_tts, slot)):
+        log.info(f"TTS cache hit: {slot.name}")
+        return path
     url = f"{API_BASE}/text-to-speech/{voice_id}?output_format={DEFAULT_FORMAT}"
-    payload = json.dumps({"text": text, "model_id": DEFAULT_MODEL}).encode()
+    payload = {"text": text, "model_id": DEFAULT_MODEL}
     for attempt in range(1 + retries):
-        req = Request(url, data=payload, headers={
-            "xi-api-key": _api_key(),
-            "Content-Type": "application/json",
-        })
-        with urlopen(req) as resp:
-            content_type = resp.headers.get("Content-Type", "")
-            data = resp.read()
+        resp = await _http_client().post(url, json=payload, headers={"xi-api-key": _api_key()})
+        resp.raise_for_status()
+        content_type = resp.headers.get("Content-Type", "")
+        data = resp.content
         if not _validate_mp3(data):
             log.warning(f"TTS attempt {attempt+1}: invalid MP3 (Content-Type={content_type}, {len(data)} bytes)")
             if attempt < retries:
                 continue
             raise ValueError(f"API returned invalid audio after {1+retries} attempts")
         break
-    fd, path = tempfile.mkstemp(prefix=TEMP_PREFIX, suffix=".mp3")
-    with os.fdopen(fd, "wb") as f:
-        f.write(data)
-    return path
+    return await asyncio.to_thread(_store_tts, data, slot)
 
 
-def _fetch_dialogue(inputs: list[dict], retries: int = 2) -> str:
+# (path, download task) once STREAM_START_BYTES are on disk; task is None if already complete
+async def _stream_tts(text: str, voice_id: str, use_cache: bool = True) -> tuple[str, asyncio.Task | None]:
+    slot = _tts_cache_slot(voice_id, DEFAULT_MODEL, DEFAULT_FORMAT, text) if use_cache else None
+    if slot is not None and (path := await asyncio.to_thread(_cached_tts, slot)):
+        log.info(f"TTS cache hit: {slot.name}")
+        return path, None
+    url = f"{API_BASE}/text-to-speech/{voice_id}/stream?output_format={DEFAULT_FORMAT}"
+    payload = {"text": text, "model_id": DEFAULT_MODEL}
+    fd, path = tempfile.mkstemp(prefix=TEMP_PREFIX, suffix=".mp3")
+    started = asyncio.get_running_loop().create_future()
+
+    async def _download():
+        written = 0
+        with os.fdopen(fd, "wb") as f:
+            async with _http_client().stream(
+                "POST", url, json=payload, headers={"xi-api-key": _api_key()},
+            ) as resp:
+                resp.raise_for_status()
+                async for chunk in resp.aiter_bytes(8192):
+                    if not written and not _validate_mp3(chunk):
+                        raise ValueError(f"API streamed invalid audio ({len(chunk)} bytes)")
+                    f.write(chunk)
+                    f.flush()
+                    written += len(chunk)
+                    if written >= STREAM_START_BYTES and not started.done():
+                        started.set_result(None)
+        if not written:
+            raise ValueError("API streamed no audio")
+        if slot is not None:
+            await asyncio.to_thread(_publish_to_cache, path, slot)
+
+    download = asyncio.create_task(_download())
+    await asyncio.wait({download, started}, return_when=asyncio.FIRST_COMPLETED)
+    if started.done():
+        return path, download
+    try:
+        download.result()
+    except Exception as e:
+        log.warning(f"TTS stream failed before playback could start ({e}); retrying buffered")
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+        return await _fetch_tts(text, voice_id, use_cache=use_cache), None
+    return path, None
+
+
+async def _fetch_dialogue(inputs: list[dict], retries: int = 2, use_cache: bool = True) -> str:
+    slot = None
+    if use_cache:
+        canonical = json.dumps(inputs, sort_keys=True, separators=(",", ":"))
+        slot = _tts_cache_slot("dialogue", DEFAULT_MODEL, DEFAULT_FORMAT, canonical)
+        if path := await asyncio.to_thread(_cached_tts, slot):
+            log.info(f"Dialogue cache hit: {slot.name}")
+            return path
     url = f"{API_BASE}/text-to-dialogue?output_format={DEFAULT_FORMAT}"
-    payload = json.dumps({"inputs": inputs, "model_id": DEFAULT_MODEL}).encode()
+    payload = {"inputs": inputs, "model_id": DEFAULT_MODEL}
     for attempt in range(1 + retries):
-        req = Request(url, data=payload, headers={
-            "xi-api-key": _api_key(),
-            "Content-Type": "application/json",
-        })
-        with urlopen(req) as resp:
-            data = resp.read()
+        resp = await _http_client().post(url, json=payload, headers={"xi-api-key": _api_key()})
+        resp.raise_for_status()
+        data = resp.content
         if not _validate_mp3(data):
             log.warning(f"Dialogue attempt {attempt+1}: invalid MP3 ({len(data)} bytes)")
             if attempt < retries:
                 continue
             raise ValueError(f"API returned invalid audio after {1+retries} attempts")
         break
-    fd, path = tempfile.mkstemp(prefix=TEMP_PREFIX, suffix=".mp3")
-    with os.fdopen(fd, "wb") as f:
-        f.write(data)
-    return path
+    return await asyncio.to_thread(_store_tts, data, slot)
+
+
+# --- Playback Process ---
+
+# Process-like handle for a posix_spawn'd player; exit is watched via pidfd (Linux) or kqueue (macOS)
+class _PlayerProcess:
+    def __init__(self, pid: int):
+        self.pid = pid
+        self.returncode: int | None = None
+        self._loop = asyncio.get_running_loop()
+        self._exited = self._loop.create_future()
+        if hasattr(os, "pidfd_open"):
+            self._fd = os.pidfd_open(pid)
+            self._kq = None
+        else:
+            self._kq = select.kqueue()
+            self._fd = self._kq.fileno()
+            try:
+                self._kq.control([select.kevent(
+                    pid, select.KQ_FILTER_PROC,
+                    select.KQ_EV_ADD | select.KQ_EV_ONESHOT, select.KQ_NOTE_EXIT,
+                )], 0, 0)
+            except ProcessLookupError:
+                self._reap()  # Exited before we could watch it
+                return
+            except OSError:
+                self._kq.close()
+                raise
+        self._loop.add_reader(self._fd, self._reap)
+
+    def _reap(self):
+        if self._kq is None or not self._kq.closed:
+            self._loop.remove_reader(self._fd)
+        _, status = os.waitpid(self.pid, 0)
+        self.returncode = os.waitstatus_to_exitcode(status)
+        if self._kq is not None:
+            self._kq.close()
+        else:
+            os.close(self._fd)
+        self._exited.set_result(self.returncode)
+
+    async def wait(self) -> int:
+        return await asyncio.shield(self._exited)
+
+    def send_signal(self, sig: int):
+        # Unreaped pids aren't reused
+        if self.returncode is not None:
+            raise ProcessLookupError
+        os.kill(self.pid, sig)
+
+    def kill(self):
+        self.send_signal(signal.SIGKILL)
+
+
+async def _spawn_player(*argv: str) -> "_PlayerProcess | asyncio.subprocess.Process":
+    if hasattr(os, "posix_spawnp") and (hasattr(os, "pidfd_open") or hasattr(select, "kqueue")):
+        pid = os.posix_spawnp(argv[0], argv, os.environ, file_actions=[
+            (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+            (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+        ])
+        try:
+            return _PlayerProcess(pid)
+        except OSError as e:
+            # Unwatchable (ENOSYS, EMFILE): don't leave it playing untracked
+            log.warning(f"Player exit watch failed ({e}); falling back to a subprocess")
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+    return await asyncio.create_subprocess_exec(
+        *argv,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
 
 
 # --- Audio Queue ---
@@ -348,6 +860,9 @@ class QueueEntry:
     is_replay: bool = False
     ready: asyncio.Event = field(default_factory=asyncio.Event)
     fetch_failed: bool = False
+    probe: asyncio.Task | None = None
+    download: asyncio.Task | None = None  # Still-running streamed TTS download
+    seq: int = 0  # Queue order; priority entries get negative numbers
 
     def __post_init__(self):
         if not self.history_id:
@@ -358,52 +873,128 @@ class QueueEntry:
 
 class AudioQueue:
     def __init__(self, broadcaster: SSEBroadcaster):
-        self._deque: collections.deque[QueueEntry] = collections.deque()
+        # One FIFO per channel (None = unchannelled); entries carry a global seq so the
+        # next pick only compares channel heads instead of scanning the whole queue
+        self._channels: dict[str | None, collections.deque[QueueEntry]] = {}
+        self._next_seq = 0
+        self._next_priority_seq = 0
         self._has_items = asyncio.Event()
         self._paused_global = False
         self._resume_event = asyncio.Event()
         self._resume_event.set()
         self._paused_channels: set[str] = set()
+        self._paused_channels_sorted: tuple[str, ...] = ()  # Re-sorted only when the set changes
         self._current: QueueEntry | None = None
-        self._process: asyncio.subprocess.Process | None = None
-        self._history: list[dict] = []
+        self._process: _PlayerProcess | asyncio.subprocess.Process | None = None
+        self._history: collections.deque[dict] = collections.deque(maxlen=MAX_HISTORY)
         self._broadcaster = broadcaster
         self._cache_dir = CACHE_DIR
         self._cache_dir.mkdir(parents=True, exist_ok=True)
         self._pause_requested = False
-        self._play_start: float = 0.0
         self._seek_offset: float | None = None
 
     def start(self):
         asyncio.create_task(self._worker())
 
+    def prefetch_probe(self, entry: QueueEntry) -> asyncio.Task:
+        """Start probing an entry's audio as soon as it is on disk, so queued
+        clips are analysed in parallel rather than when they reach the head."""
+        if entry.probe is None:
+            entry.probe = asyncio.create_task(_probe_and_envelope(entry.audio_path, background=True))
+        return entry.probe
+
+    async def _next_stream_segment(self, entry: QueueEntry, start: int) -> tuple[str, int, float] | None:
+        # None once the download is over (or its frames can't be walked)
+        while not entry.download.done():
+            try:
+                landed = os.path.getsize(entry.audio_path) - start
+            except OSError:
+                landed = 0
+            if landed >= STREAM_START_BYTES:
+                return await asyncio.to_thread(_cut_mp3_segment, entry.audio_path, start)
+            await asyncio.wait({entry.download}, timeout=0.1)
+        return None
+
+    @staticmethod
+    async def _finish_download(entry: QueueEntry) -> bool:
+        # False if skip/clear cancelled it; re-raises a failed download
+        await asyncio.wait({entry.download})
+        if entry.download.cancelled():
+            return False
+        entry.download.result()
+        return True
+
+    async def _prepare_entry(self, entry: QueueEntry) -> tuple[float | None, str]:
+        """Probe a fully downloaded entry, cache it for replay, and time its dialogue segments."""
+        duration, envelope = await self.prefetch_probe(entry)
+
+        # Cache MP3 for history replay. Replays aren't recorded in history, and
+        # their source is already cached under the original id.
+        if not entry.is_replay:
+            cache_path = self._cache_dir / f"{entry.history_id}.mp3"
+            try:
+                await _link_or_copy(entry.audio_path, cache_path)
+            except Exception:
+                pass
+
+        if entry.entry_type == "dialogue" and entry.dialogue_segments and duration:
+            total_chars = sum(s.get("chars", 1) for s in entry.dialogue_segments)
+            seg_offset = 0.0
+            for seg in entry.dialogue_segments:
+                seg_dur = (seg.get("chars", 1) / max(total_chars, 1)) * duration
+                seg["start"] = round(seg_offset, 3)
+                seg["end"] = round(seg_offset + seg_dur, 3)
+                seg_offset += seg_dur
+        return duration, envelope
+
+    async def _broadcast_idle(self):
+        queued = self.queued
+        if queued:
+            await self._broadcaster.send("voice_active", _idle_event(queued))
+        else:
+            self._broadcaster.send_frame("voice_active", _IDLE_FRAME)
+
+    @property
+    def queued(self) -> int:
+        return sum(len(entries) for entries in self._channels.values())
+
+    def _queued_entries(self):
+        """All queued entries in play order."""
+        return heapq.merge(*self._channels.values(), key=lambda e: e.seq)
+
     def enqueue(self, entry: QueueEntry) -> int:
+        entries = self._channels.setdefault(entry.channel, collections.deque())
         if entry.priority:
-            self._deque.appendleft(entry)
+            self._next_priority_seq -= 1
+            entry.seq = self._next_priority_seq
+            entries.appendleft(entry)
         else:
-            self._deque.append(entry)
+            entry.seq = self._next_seq
+            self._next_seq += 1
+            entries.append(entry)
         self._has_items.set()
-        return len(self._deque)
+        self._broadcaster.invalidate_state()
+        return self.queued
+
+    def mark_ready(self, entry: QueueEntry):
+        """Flag an entry's audio as fetched (or failed) and wake the worker if it waits on it."""
+        entry.ready.set()
+        self._broadcaster.invalidate_state()
 
     def _pick_next(self) -> QueueEntry | None:
-        for i, entry in enumerate(self._deque):
-            if entry.channel and entry.channel in self._paused_channels:
+        best: collections.deque[QueueEntry] | None = None
+        for channel, entries in self._channels.items():
+            if channel and channel in self._paused_channels:
                 continue
-            del self._deque[i]
-            return entry
-        return None
-
-    async def _trim_audio(self, path: str, offset_seconds: float) -> str:
-        fd, tmp = tempfile.mkstemp(prefix=TEMP_PREFIX, suffix=".mp3")
-        os.close(fd)
-        proc = await asyncio.create_subprocess_exec(
-            FFMPEG, "-ss", str(offset_seconds), "-i", path,
-            "-acodec", "libmp3lame", "-ab", "128k", "-y", tmp,
-            stdout=asyncio.subprocess.DEVNULL,
-            stderr=asyncio.subprocess.DEVNULL,
-        )
-        await proc.wait()
-        return tmp
+            if best is None or entries[0].seq < best[0].seq:
+                best = entries
+        if best is None:
+            return None
+        self._broadcaster.invalidate_state()
+        entry = best.popleft()
+        if not best:
+            del self._channels[entry.channel]
+        return entry
 
     async def _worker(self):
         while True:
@@ -432,14 +1023,9 @@ class AudioQueue:
                 # Jump to finally block
                 self._current = None
                 self._process = None
-                if not self._deque:
+                if not self._channels:
                     self._has_items.clear()
-                await self._broadcaster.send("voice_active", {
-                    "id": None, "voice": None, "type": "idle",
-                    "text": None, "duration": None, "segments": None,
-                    "queued": len(self._deque),
-                    "channel": None, "priority": False,
-                })
+                await self._broadcast_idle()
                 if not entry.is_replay:
                     history_entry = {
                         "id": entry.history_id,
@@ -455,52 +1041,50 @@ class AudioQueue:
                     await self._broadcaster.send("history_update", history_entry)
                 continue
 
+            # Streaming: play the download in segments of whole frames as they land,
+            # then the remainder once it completes; stream_pos is where the next starts
+            streaming = entry.download is not None and not entry.download.done()
+            stream_pos = 0
             try:
-                duration, envelope = await asyncio.gather(
-                    asyncio.to_thread(_get_audio_duration, entry.audio_path),
-                    asyncio.to_thread(_extract_envelope, entry.audio_path),
-                )
-
-                # Cache MP3 for history replay
-                cache_path = self._cache_dir / f"{entry.history_id}.mp3"
-                try:
-                    await asyncio.to_thread(shutil.copy2, entry.audio_path, str(cache_path))
-                except Exception:
-                    pass
-
-                if entry.entry_type == "dialogue" and entry.dialogue_segments and duration:
-                    total_chars = sum(s.get("chars", 1) for s in entry.dialogue_segments)
-                    seg_offset = 0.0
-                    for seg in entry.dialogue_segments:
-                        seg_dur = (seg.get("chars", 1) / max(total_chars, 1)) * duration
-                        seg["start"] = round(seg_offset, 3)
-                        seg["end"] = round(seg_offset + seg_dur, 3)
-                        seg_offset += seg_dur
+                if streaming:
+                    duration, envelope = None, None
+                else:
+                    # A download that finished before pickup may still have failed
+                    if entry.download is not None and not await self._finish_download(entry):
+                        raise RuntimeError("download cancelled before playback")
+                    duration, envelope = await self._prepare_entry(entry)
 
                 while True:
-                    # Determine which file to play
-                    if play_offset > 0:
-                        trimmed_path = await self._trim_audio(entry.audio_path, play_offset)
-                        play_file = trimmed_path
-                    else:
-                        play_file = entry.audio_path
-
-                    # Get envelope for current play file
-                    play_dur, play_env = None, envelope
-                    if play_offset > 0:
-                        play_dur, play_env = await asyncio.gather(
-                            asyncio.to_thread(_get_audio_duration, play_file),
-                            asyncio.to_thread(_extract_envelope, play_file),
-                        )
-                    else:
-                        play_dur = duration
-
-                    self._process = await asyncio.create_subprocess_exec(
-                        "afplay", play_file,
-                        stdout=asyncio.subprocess.DEVNULL,
-                        stderr=asyncio.subprocess.DEVNULL,
-                    )
-                    self._play_start = time.monotonic()
+                    # Determine which file to play, and its duration/envelope
+                    play_file, play_dur, play_env = entry.audio_path, duration, envelope
+                    if streaming:
+                        segment = await self._next_stream_segment(entry, stream_pos)
+                        if segment is None:
+                            # Download over (or the stream can't be split into frames)
+                            if not await self._finish_download(entry):
+                                break  # Skipped or cleared mid-stream
+                            streaming = False
+                            duration, envelope = await self._prepare_entry(entry)
+                            play_dur, play_env = duration, envelope
+                            if stream_pos:
+                                segment = await asyncio.to_thread(
+                                    _cut_mp3_segment, entry.audio_path, stream_pos)
+                                if segment is None and (not duration or play_offset >= duration - 0.05):
+                                    break  # The streamed segments covered it all
+                        if segment is not None:
+                            trimmed_path, stream_pos, play_dur = segment
+                            play_file, play_env = trimmed_path, None
+                            if not streaming:
+                                play_dur, play_env = await _probe_and_envelope(play_file)
+                    if play_file == entry.audio_path and play_offset > 0:
+                        play_file = await _trim_audio(entry.audio_path, play_offset)
+                        if play_file != entry.audio_path:
+                            trimmed_path = play_file
+                            play_dur, play_env = await _probe_and_envelope(play_file)
+
+                    # Don't start a segment or a seek target while globally paused
+                    await self._resume_event.wait()
+                    self._process = await _spawn_player(AFPLAY, play_file)
 
                     voice_event = {
                         "id": entry.id,
@@ -511,13 +1095,13 @@ class AudioQueue:
                         "total_duration": round(duration, 3) if duration else None,
                         "offset": round(play_offset, 3),
                         "segments": entry.dialogue_segments if entry.entry_type == "dialogue" else None,
-                        "envelope": play_env,
+                        "envelope_b64": play_env,
                         "chunk_ms": 50,
-                        "queued": len(self._deque),
+                        "queued": self.queued,
                         "channel": entry.channel,
                         "priority": entry.priority,
                     }
-                    await self._broadcaster.send("voice_active", voice_event)
+                    await self._broadcaster.send_coalesced("voice_active", voice_event)
 
                     ret = await self._process.wait()
                     log.info(f"Worker: process exited rc={ret}, pause_requested={self._pause_requested}")
@@ -533,28 +1117,35 @@ class AudioQueue:
                             pass
                         trimmed_path = None
 
-                    if self._pause_requested:
-                        if self._seek_offset is not None:
-                            play_offset = self._seek_offset
-                            self._seek_offset = None
-                            self._pause_requested = False
-                            self._process = None
-                            log.info(f"Worker: seek to offset={play_offset:.2f}s")
-                            continue
-                        elapsed = time.monotonic() - self._play_start
-                        play_offset += elapsed
+                    if streaming and self._seek_offset is not None:
+                        # Seeks land in the finished file
+                        if not await self._finish_download(entry):
+                            break
+                        streaming = False
+                        duration, envelope = await self._prepare_entry(entry)
+                    elif streaming:
+                        if ret != 0:
+                            break  # Skipped
+                        play_offset += play_dur
+                        log.info(f"Worker: stream continues at offset={play_offset:.2f}s")
+                        continue
+
+                    if self._pause_requested and self._seek_offset is not None:
+                        play_offset = self._seek_offset
+                        self._seek_offset = None
                         self._pause_requested = False
                         self._process = None
-                        log.info(f"Worker: paused at offset={play_offset:.2f}s, waiting for resume")
+                        log.info(f"Worker: seek to offset={play_offset:.2f}s")
+                        # Seeking a paused (stopped) player restarts it only on resume
                         await self._resume_event.wait()
-                        log.info(f"Worker: resumed, will play from offset={play_offset:.2f}s")
                         continue
-                    else:
-                        break
+                    break
             except Exception as exc:
                 play_failed = True
                 log.error(f"Worker: exception in playback loop: {exc}", exc_info=True)
             finally:
+                if entry.download is not None and not entry.download.done():
+                    entry.download.cancel()
                 if trimmed_path:
                     try:
                         os.unlink(trimmed_path)
@@ -577,23 +1168,16 @@ class AudioQueue:
                         "failed": play_failed,
                     }
                     self._history.append(history_entry)
-                    if len(self._history) > MAX_HISTORY:
-                        self._history = self._history[-MAX_HISTORY:]
 
                     await self._broadcaster.send("history_update", history_entry)
 
                 self._current = None
                 self._process = None
 
-                if not self._deque:
+                if not self._channels:
                     self._has_items.clear()
 
-                await self._broadcaster.send("voice_active", {
-                    "id": None, "voice": None, "type": "idle",
-                    "text": None, "duration": None, "segments": None,
-                    "queued": len(self._deque),
-                    "channel": None, "priority": False,
-                })
+                await self._broadcast_idle()
 
     def status(self, channel: str | None = None) -> dict:
         items = []
@@ -608,7 +1192,7 @@ class AudioQueue:
                     "priority": self._current.priority,
                 })
 
-        for i, entry in enumerate(self._deque):
+        for i, entry in enumerate(self._queued_entries()):
             if channel is not None and entry.channel != channel:
                 continue
             status = "queued" if entry.ready.is_set() else "pending"
@@ -623,56 +1207,69 @@ class AudioQueue:
 
         return {
             "playing": self._current is not None,
-            "queued": len(self._deque),
+            "queued": self.queued,
             "total": len(items),
             "items": items,
             "paused": self._paused_global,
-            "channel_paused": sorted(self._paused_channels),
+            "channel_paused": self._paused_channels_sorted,
         }
 
     async def clear(self, channel: str | None = None) -> int:
+        self._broadcaster.invalidate_state()
         cleared = 0
         if channel is None:
-            while self._deque:
-                entry = self._deque.popleft()
+            for entry in self._queued_entries():
                 entry.fetch_failed = True  # Signal bg fetch to clean up
+                if entry.download is not None:
+                    entry.download.cancel()
                 if entry.audio_path:
                     try:
                         os.unlink(entry.audio_path)
                     except OSError:
                         pass
                 cleared += 1
+            self._channels.clear()
+            streaming = self._cancel_current_download()
             if self._process and self._process.returncode is None:
                 try:
                     self._process.kill()
                 except ProcessLookupError:
                     pass
                 cleared += 1
+            elif streaming:
+                cleared += 1  # Between segments, waiting on the download
             self._has_items.clear()
         else:
-            new_deque = collections.deque()
-            for entry in self._deque:
-                if entry.channel == channel:
-                    try:
-                        os.unlink(entry.audio_path)
-                    except OSError:
-                        pass
-                    cleared += 1
-                else:
-                    new_deque.append(entry)
-            self._deque = new_deque
-            if not self._deque:
+            for entry in self._channels.pop(channel, ()):
+                entry.fetch_failed = True
+                if entry.download is not None:
+                    entry.download.cancel()
+                try:
+                    os.unlink(entry.audio_path)
+                except OSError:
+                    pass
+                cleared += 1
+            if not self._channels:
                 self._has_items.clear()
         return cleared
 
+    def _cancel_current_download(self) -> bool:
+        """Stop a streaming download for the playing entry. True if one was running."""
+        entry = self._current
+        if entry is None or entry.download is None or entry.download.done():
+            return False
+        entry.download.cancel()
+        return True
+
     async def skip(self) -> bool:
+        skipped = self._cancel_current_download()
         if self._process and self._process.returncode is None:
             try:
                 self._process.kill()
             except ProcessLookupError:
                 pass
             return True
-        return False
+        return skipped
 
     def seek(self, offset: float) -> bool:
         if not self._current or not self._process or self._process.returncode is not None:
@@ -688,36 +1285,54 @@ class AudioQueue:
         return True
 
     def pause(self, channel: str | None = None):
+        self._broadcaster.invalidate_state()
         if channel is None:
             self._paused_global = True
             self._resume_event.clear()
+            # Freeze afplay in place; SIGCONT resumes at the exact sample, no re-decode
             if self._process and self._process.returncode is None:
-                self._pause_requested = True
                 try:
-                    self._process.kill()
-                    log.info("Pause: killed process, pause_requested=True")
+                    self._process.send_signal(signal.SIGSTOP)
+                    log.info("Pause: stopped process")
                 except ProcessLookupError:
                     log.warning("Pause: process already dead")
-                    self._pause_requested = False
             else:
-                log.info("Pause: no active process to kill")
+                log.info("Pause: no active process to stop")
         else:
             self._paused_channels.add(channel)
+            self._paused_channels_sorted = tuple(sorted(self._paused_channels))
 
     def resume(self, channel: str | None = None):
+        self._broadcaster.invalidate_state()
         if channel is None:
             self._paused_global = False
             self._resume_event.set()
+            if self._process and self._process.returncode is None:
+                try:
+                    self._process.send_signal(signal.SIGCONT)
+                except ProcessLookupError:
+                    pass
             log.info("Resume: set resume event")
         else:
             self._paused_channels.discard(channel)
+            self._paused_channels_sorted = tuple(sorted(self._paused_channels))
+
+    def pause_state(self) -> dict:
+        return {
+            "global_paused": self._paused_global,
+            "channel_paused": self._paused_channels_sorted,
+        }
 
     def get_history(self, limit: int = 50, offset: int = 0, channel: str | None = None) -> list[dict]:
-        entries = self._history
+        entries = reversed(self._history)
         if channel is not None:
-            entries = [e for e in entries if e.get("channel") == channel]
-        entries = list(reversed(entries))
-        return entries[offset:offset + limit]
+            entries = (e for e in entries if e.get("channel") == channel)
+        return list(itertools.islice(entries, offset, offset + limit))
+
+    def get_history_page(self, limit: int = 50, offset: int = 0,
+                         channel: str | None = None) -> tuple[list[dict], int]:
+        """A page of history plus the total number of entries, taken together."""
+        return self.get_history(limit, offset, channel), len(self._history)
 
     def find_history(self, history_id: str) -> dict | None:
         for entry in reversed(self._history):
@@ -726,49 +1341,116 @@ class AudioQueue:
         return None
 
 
+async def _link_or_copy(src: str | Path, dst: str | Path):
+    """Give audio a second name: a hardlink costs no bytes and no thread hop, and each
+    name survives the other's unlink. A real copy is the cross-device fallback.
+    An existing dst is left as is."""
+    try:
+        os.link(src, dst)
+        return
+    except FileExistsError:
+        return
+    except OSError:
+        pass
+    await asyncio.to_thread(shutil.copy2, src, dst)
+
+
 def _clean_old_cache(cache_dir: Path, max_age_hours: int = 24):
     if not cache_dir.exists():
         return
     cutoff = time.time() - max_age_hours * 3600
-    for f in cache_dir.iterdir():
-        if f.is_file() and f.stat().st_mtime < cutoff:
+    # scandir's entries know their type from the listing; only files get a stat call
+    with os.scandir(cache_dir) as it:
+        for f in it:
             try:
-                f.unlink()
+                if f.is_file(follow_symlinks=False) and f.stat().st_mtime < cutoff:
+                    os.unlink(f.path)
             except OSError:
                 pass
 
 
 # --- REST API Route Handlers ---
 
+# Per-(route, status) counts with a sampled log line; plain ASGI so /events streams unwrapped
+class RequestMetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        metrics = scope["app"].state.metrics
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                # The router records the matched route in the shared scope
+                route = scope.get("route")
+                key = (route.path if route is not None else "<unmatched>", message["status"])
+                metrics[key] = metrics.get(key, 0) + 1
+            await send(message)
+
+        await self.app(scope, receive, send_with_status)
+        metrics["requests"] = total = metrics.get("requests", 0) + 1
+        if total % METRICS_LOG_EVERY == 0:
+            top = sorted(((n, k) for k, n in metrics.items() if k != "requests"), reverse=True)[:5]
+            log.info(f"Requests: {total} total, top {', '.join(f'{p} {s}={n}' for n, (p, s) in top)}")
+
+
+# Raises ValueError on invalid JSON; a Content-Length body is read into one exact-size buffer
+async def _read_json(request: StarletteRequest, *, allow_empty: bool = False):
+    try:
+        size = int(request.headers.get("content-length", ""))
+    except ValueError:
+        size = 0
+    if not 0 < size <= MAX_PREALLOC_BODY:
+        raw = await request.body()
+        if not raw and allow_empty:
+            return {}
+        return orjson.loads(raw)
+    buf = bytearray(size)
+    view = memoryview(buf)
+    offset = 0
+    async for chunk in request.stream():
+        end = offset + len(chunk)
+        if end > size:
+            raise ValueError("Body longer than Content-Length")
+        view[offset:end] = chunk
+        offset = end
+    view.release()
+    if offset < size:
+        del buf[offset:]
+    return orjson.loads(buf)
+
 async def handle_speak(request: StarletteRequest) -> JSONResponse:
     queue: AudioQueue = request.app.state.queue
     try:
-        body = await request.json()
-    except Exception:
-        return JSONResponse({"error": "Invalid JSON"}, status_code=400)
+        body = await _read_json(request)
+    except ValueError:
+        return _ERR_INVALID_JSON
     if not isinstance(body, dict):
-        return JSONResponse({"error": "Expected JSON object"}, status_code=400)
+        return _ERR_EXPECTED_OBJECT
 
     text = body.get("text", "")
     if not isinstance(text, str) or not text.strip():
-        return JSONResponse({"error": "No text provided"}, status_code=400)
+        return ORJSONResponse({"error": "No text provided"}, status_code=400)
     if len(text) > MAX_TEXT_LENGTH:
-        return JSONResponse({"error": f"Text too long (max {MAX_TEXT_LENGTH} chars)"}, status_code=400)
+        return ORJSONResponse({"error": f"Text too long (max {MAX_TEXT_LENGTH} chars)"}, status_code=400)
 
     voice_raw = body.get("voice")
     if voice_raw is not None and not isinstance(voice_raw, str):
-        return JSONResponse({"error": "Voice must be a string"}, status_code=400)
+        return ORJSONResponse({"error": "Voice must be a string"}, status_code=400)
     channel = body.get("channel")
     if channel is not None and not isinstance(channel, str):
-        return JSONResponse({"error": "Channel must be a string"}, status_code=400)
+        return _ERR_CHANNEL_TYPE
+    use_cache = body.get("cache", True) is not False
 
     vid = await resolve_voice_async(voice_raw)
     if not _api_key():
-        return JSONResponse({"error": "ELEVENLABS_API_KEY not set"}, status_code=500)
+        return _ERR_NO_API_KEY
     if not vid:
-        return JSONResponse({"error": "No voice specified and ELEVENLABS_VOICE_ID not set"}, status_code=400)
+        return ORJSONResponse({"error": "No voice specified and ELEVENLABS_VOICE_ID not set"}, status_code=400)
 
-    entry_id = uuid.uuid4().hex[:8]
+    entry_id = _new_id()
     entry = QueueEntry(
         id=entry_id,
         audio_path="",
@@ -783,17 +1465,35 @@ async def handle_speak(request: StarletteRequest) -> JSONResponse:
 
     async def _fetch_bg():
         try:
-            path = await asyncio.to_thread(_fetch_tts, text, vid)
+            if SPEAK_STREAMING:
+                path, entry.download = await _stream_tts(text, vid, use_cache=use_cache)
+            else:
+                path = await _fetch_tts(text, vid, use_cache=use_cache)
+            if entry.fetch_failed:
+                # Cleared while fetching: stop the download and drop the file
+                if entry.download is not None:
+                    entry.download.cancel()
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+                return
             entry.audio_path = path
+            if entry.download is None:
+                queue.prefetch_probe(entry)
+            else:
+                # Probe as soon as the download lands, ready for the final segment
+                entry.download.add_done_callback(
+                    lambda t: t.cancelled() or t.exception() or queue.prefetch_probe(entry))
         except Exception as exc:
             log.error(f"Background TTS fetch failed for {entry_id}: {exc}")
             entry.fetch_failed = True
         finally:
-            entry.ready.set()
+            queue.mark_ready(entry)
 
     asyncio.create_task(_fetch_bg())
 
-    return JSONResponse({
+    return ORJSONResponse({
         "id": entry.id,
         "position": pos,
         "voice": entry.voice_label,
@@ -804,37 +1504,38 @@ async def handle_speak(request: StarletteRequest) -> JSONResponse:
 async def handle_speak_dialogue(request: StarletteRequest) -> JSONResponse:
     queue: AudioQueue = request.app.state.queue
     try:
-        body = await request.json()
-    except Exception:
-        return JSONResponse({"error": "Invalid JSON"}, status_code=400)
+        body = await _read_json(request)
+    except ValueError:
+        return _ERR_INVALID_JSON
     if not isinstance(body, dict):
-        return JSONResponse({"error": "Expected JSON object"}, status_code=400)
+        return _ERR_EXPECTED_OBJECT
 
     dialogue = body.get("dialogue", [])
     if not isinstance(dialogue, list) or not dialogue:
-        return JSONResponse({"error": "No dialogue provided"}, status_code=400)
+        return ORJSONResponse({"error": "No dialogue provided"}, status_code=400)
     channel = body.get("channel")
     if channel is not None and not isinstance(channel, str):
-        return JSONResponse({"error": "Channel must be a string"}, status_code=400)
+        return _ERR_CHANNEL_TYPE
+    use_cache = body.get("cache", True) is not False
     if not _api_key():
-        return JSONResponse({"error": "ELEVENLABS_API_KEY not set"}, status_code=500)
+        return _ERR_NO_API_KEY
 
     inputs = []
     labels = []
     for i, line in enumerate(dialogue):
         if not isinstance(line, dict):
-            return JSONResponse({"error": f"Dialogue item {i} must be an object"}, status_code=400)
+            return ORJSONResponse({"error": f"Dialogue item {i} must be an object"}, status_code=400)
         text = line.get("text")
         voice = line.get("voice")
         if not isinstance(text, str) or not text.strip():
-            return JSONResponse({"error": f"Dialogue item {i} missing 'text'"}, status_code=400)
+            return ORJSONResponse({"error": f"Dialogue item {i} missing 'text'"}, status_code=400)
         if len(text) > MAX_TEXT_LENGTH:
-            return JSONResponse({"error": f"Dialogue item {i} text too long"}, status_code=400)
+            return ORJSONResponse({"error": f"Dialogue item {i} text too long"}, status_code=400)
         if voice is not None and not isinstance(voice, str):
-            return JSONResponse({"error": f"Dialogue item {i} voice must be a string"}, status_code=400)
+            return ORJSONResponse({"error": f"Dialogue item {i} voice must be a string"}, status_code=400)
         vid = await resolve_voice_async(voice)
         if not vid:
-            return JSONResponse({"error": f"Cannot resolve voice: {voice}"}, status_code=400)
+            return ORJSONResponse({"error": f"Cannot resolve voice: {voice}"}, status_code=400)
         inputs.append({"voice_id": vid, "text": text})
         labels.append(voice_label(vid))
 
@@ -846,7 +1547,7 @@ async def handle_speak_dialogue(request: StarletteRequest) -> JSONResponse:
         for lbl, line in zip(labels, dialogue)
     ]
 
-    entry_id = uuid.uuid4().hex[:8]
+    entry_id = _new_id()
     entry = QueueEntry(
         id=entry_id,
         audio_path="",
@@ -863,17 +1564,18 @@ async def handle_speak_dialogue(request: StarletteRequest) -> JSONResponse:
 
     async def _fetch_bg():
         try:
-            path = await asyncio.to_thread(_fetch_dialogue, inputs)
+            path = await _fetch_dialogue(inputs, use_cache=use_cache)
             entry.audio_path = path
+            queue.prefetch_probe(entry)
         except Exception as exc:
             log.error(f"Background dialogue fetch failed for {entry_id}: {exc}")
             entry.fetch_failed = True
         finally:
-            entry.ready.set()
+            queue.mark_ready(entry)
 
     asyncio.create_task(_fetch_bg())
 
-    return JSONResponse({
+    return ORJSONResponse({
         "id": entry.id,
         "position": pos,
         "voices": voices_str,
@@ -883,89 +1585,83 @@ async def handle_speak_dialogue(request: StarletteRequest) -> JSONResponse:
 async def handle_queue_status(request: StarletteRequest) -> JSONResponse:
     queue: AudioQueue = request.app.state.queue
     channel = request.query_params.get("channel")
-    return JSONResponse(queue.status(channel=channel))
+    return ORJSONResponse(queue.status(channel=channel))
 
 
 async def handle_queue_clear(request: StarletteRequest) -> JSONResponse:
     queue: AudioQueue = request.app.state.queue
     try:
-        body = await request.json()
-        if not isinstance(body, dict):
-            body = {}
-    except Exception:
+        body = await _read_json(request, allow_empty=True)
+    except ValueError:
+        body = {}
+    if not isinstance(body, dict):
         body = {}
     channel = body.get("channel")
     if channel is not None and not isinstance(channel, str):
-        return JSONResponse({"error": "Channel must be a string"}, status_code=400)
+        return _ERR_CHANNEL_TYPE
     n = await queue.clear(channel=channel)
-    return JSONResponse({"cleared": n})
+    return ORJSONResponse({"cleared": n})
 
 
 async def handle_queue_skip(request: StarletteRequest) -> JSONResponse:
     queue: AudioQueue = request.app.state.queue
     skipped = await queue.skip()
-    return JSONResponse({"skipped": skipped})
+    return ORJSONResponse({"skipped": skipped})
 
 
 async def handle_queue_seek(request: StarletteRequest) -> JSONResponse:
     queue: AudioQueue = request.app.state.queue
     try:
-        body = await request.json()
-    except Exception:
-        return JSONResponse({"error": "Invalid JSON"}, status_code=400)
+        body = await _read_json(request)
+    except ValueError:
+        return _ERR_INVALID_JSON
     if not isinstance(body, dict):
-        return JSONResponse({"error": "Expected JSON object"}, status_code=400)
+        return _ERR_EXPECTED_OBJECT
     offset = body.get("offset")
     if offset is None:
-        return JSONResponse({"error": "No offset provided"}, status_code=400)
+        return ORJSONResponse({"error": "No offset provided"}, status_code=400)
     try:
         offset = float(offset)
     except (TypeError, ValueError):
-        return JSONResponse({"error": "Invalid offset"}, status_code=400)
+        return ORJSONResponse({"error": "Invalid offset"}, status_code=400)
     seeked = queue.seek(max(0.0, offset))
     if not seeked:
-        return JSONResponse({"error": "Nothing playing to seek"}, status_code=409)
-    return JSONResponse({"seeked": True, "offset": offset})
+        return ORJSONResponse({"error": "Nothing playing to seek"}, status_code=409)
+    return ORJSONResponse({"seeked": True, "offset": offset})
 
 
 async def handle_queue_pause(request: StarletteRequest) -> JSONResponse:
     queue: AudioQueue = request.app.state.queue
     try:
-        body = await request.json()
-        if not isinstance(body, dict):
-            body = {}
-    except Exception:
+        body = await _read_json(request, allow_empty=True)
+    except ValueError:
+        body = {}
+    if not isinstance(body, dict):
         body = {}
     channel = body.get("channel")
     if channel is not None and not isinstance(channel, str):
-        return JSONResponse({"error": "Channel must be a string"}, status_code=400)
+        return _ERR_CHANNEL_TYPE
     queue.pause(channel=channel)
 
-    await request.app.state.broadcaster.send("pause_state", {
-        "global_paused": queue._paused_global,
-        "channel_paused": sorted(queue._paused_channels),
-    })
-    return JSONResponse({"paused": True, "channel": channel})
+    await request.app.state.broadcaster.send("pause_state", queue.pause_state())
+    return ORJSONResponse({"paused": True, "channel": channel})
 
 
 async def handle_queue_resume(request: StarletteRequest) -> JSONResponse:
     queue: AudioQueue = request.app.state.queue
     try:
-        body = await request.json()
-        if not isinstance(body, dict):
-            body = {}
-    except Exception:
+        body = await _read_json(request, allow_empty=True)
+    except ValueError:
+        body = {}
+    if not isinstance(body, dict):
         body = {}
     channel = body.get("channel")
     if channel is not None and not isinstance(channel, str):
-        return JSONResponse({"error": "Channel must be a string"}, status_code=400)
+        return _ERR_CHANNEL_TYPE
     queue.resume(channel=channel)
 
-    await request.app.state.broadcaster.send("pause_state", {
-        "global_paused": queue._paused_global,
-        "channel_paused": sorted(queue._paused_channels),
-    })
-    return JSONResponse({"resumed": True, "channel": channel})
+    await request.app.state.broadcaster.send("pause_state", queue.pause_state())
+    return ORJSONResponse({"resumed": True, "channel": channel})
 
 
 async def handle_history(request: StarletteRequest) -> JSONResponse:
@@ -979,37 +1675,38 @@ async def handle_history(request: StarletteRequest) -> JSONResponse:
     except (ValueError, TypeError):
         offset = 0
     channel = request.query_params.get("channel")
-    entries = queue.get_history(limit=limit, offset=offset, channel=channel)
-    return JSONResponse({"entries": entries, "total": len(queue._history)})
+    entries, total = queue.get_history_page(limit=limit, offset=offset, channel=channel)
+    return ORJSONResponse({"entries": entries, "total": total})
 
 
 async def handle_history_replay(request: StarletteRequest) -> JSONResponse:
     queue: AudioQueue = request.app.state.queue
     try:
-        body = await request.json()
-    except Exception:
-        return JSONResponse({"error": "Invalid JSON"}, status_code=400)
+        body = await _read_json(request)
+    except ValueError:
+        return _ERR_INVALID_JSON
     if not isinstance(body, dict):
-        return JSONResponse({"error": "Expected JSON object"}, status_code=400)
+        return _ERR_EXPECTED_OBJECT
 
     history_id = body.get("id", "")
     if not isinstance(history_id, str) or not history_id:
-        return JSONResponse({"error": "No id provided"}, status_code=400)
+        return ORJSONResponse({"error": "No id provided"}, status_code=400)
 
     entry_data = queue.find_history(history_id)
     if not entry_data:
-        return JSONResponse({"error": "Entry not found in history"}, status_code=404)
+        return ORJSONResponse({"error": "Entry not found in history"}, status_code=404)
 
     cache_path = queue._cache_dir / f"{history_id}.mp3"
     if not cache_path.exists():
-        return JSONResponse({"error": "Cached audio not found (may have expired)"}, status_code=404)
+        return ORJSONResponse({"error": "Cached audio not found (may have expired)"}, status_code=404)
 
-    # Copy cached MP3 to temp file for playback (worker deletes after play)
+    # Link cached MP3 to a temp name for playback (worker deletes after play)
     fd, tmp_path = tempfile.mkstemp(prefix=TEMP_PREFIX, suffix=".mp3")
-    with os.fdopen(fd, "wb") as f:
-        f.write(cache_path.read_bytes())
+    os.close(fd)
+    os.unlink(tmp_path)
+    await _link_or_copy(cache_path, tmp_path)
 
-    replay_id = uuid.uuid4().hex[:8]
+    replay_id = _new_id()
     entry = QueueEntry(
         id=replay_id,
         audio_path=tmp_path,
@@ -1022,7 +1719,8 @@ async def handle_history_replay(request: StarletteRequest) -> JSONResponse:
         is_replay=True,
     )
     pos = queue.enqueue(entry)
-    return JSONResponse({"id": replay_id, "position": pos, "replaying": history_id})
+    queue.prefetch_probe(entry)
+    return ORJSONResponse({"id": replay_id, "position": pos, "replaying": history_id})
 
 
 async def handle_events(request: StarletteRequest) -> StreamingResponse:
@@ -1032,12 +1730,21 @@ async def handle_events(request: StarletteRequest) -> StreamingResponse:
 
     async def stream():
         try:
-            state = queue.status()
-            state["recent_history"] = queue.get_history(limit=20)
-            yield f"event: state\ndata: {json.dumps(state)}\n\n"
+            yield broadcaster.state_snapshot(queue)
             while True:
+                # Drain everything already queued into one write instead of one per event
                 msg = await client_q.get()
-                yield msg
+                frames = []
+                while msg is not None:
+                    frames.append(msg)
+                    try:
+                        msg = client_q.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                if frames:
+                    yield b"".join(frames)
+                if msg is None:
+                    break  # Dropped as a slow consumer
         except asyncio.CancelledError:
             pass
         finally:
@@ -1056,47 +1763,105 @@ async def handle_events(request: StarletteRequest) -> StreamingResponse:
 
 async def handle_health(request: StarletteRequest) -> JSONResponse:
     queue: AudioQueue = request.app.state.queue
-    return JSONResponse({
+    return ORJSONResponse({
         "status": "ok",
         "version": "2.0",
-        "queue_size": len(queue._deque) + (1 if queue._current else 0),
+        "queue_size": queue.queued + (1 if queue._current else 0),
     })
 
 
-async def handle_index(request: StarletteRequest) -> HTMLResponse:
-    index_path = DASHBOARD_DIR / "index.html"
-    if index_path.exists():
-        return HTMLResponse(index_path.read_text())
-    return HTMLResponse("<h1>Dashboard not found</h1>", status_code=404)
+# path -> (mtime_ns, size, body, etag) of small dashboard files, revalidated by stat
+_static_cache: dict[Path, tuple[int, int, bytes, str]] = {}
+
+
+def _serve_static(request: StarletteRequest, path: Path, media_type: str,
+                  cache_control: str) -> Response | None:
+    """A dashboard file from memory, with an ETag so browsers revalidate to a 304
+    instead of re-downloading. None if the file can't be read."""
+    try:
+        st = path.stat()
+        cached = _static_cache.get(path)
+        if cached is None or cached[:2] != (st.st_mtime_ns, st.st_size):
+            body = path.read_bytes()
+            etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+            cached = _static_cache[path] = (st.st_mtime_ns, st.st_size, body, etag)
+    except OSError:
+        return None
+    headers = {"ETag": cached[3], "Cache-Control": cache_control}
+    if request.headers.get("if-none-match") == cached[3]:
+        return Response(status_code=304, headers=headers)
+    return Response(cached[2], media_type=media_type, headers=headers)
+
+
+def _serve_file(request: StarletteRequest, path: Path, media_type: str,
+                cache_control: str) -> Response | None:
+    """A large dashboard asset streamed from disk rather than held in memory.
+    The one stat feeds both the ETag and FileResponse, which would otherwise
+    stat again. None if the file is gone."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    headers = {"ETag": f'"{st.st_mtime_ns:x}-{st.st_size:x}"', "Cache-Control": cache_control}
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, media_type=media_type, headers=headers, stat_result=st)
+
+
+async def handle_index(request: StarletteRequest) -> Response:
+    # no-cache: always revalidate, so dashboard edits show up on the next load
+    response = _serve_static(request, INDEX_PATH, "text/html", "no-cache")
+    return response or HTMLResponse("<h1>Dashboard not found</h1>", status_code=404)
+
 
+# (mtime_ns, response body) of voices.json, re-read only when the file changes
+_voices_body: tuple[int, bytes] | None = None
 
-async def handle_voices(request: StarletteRequest) -> JSONResponse:
-    voices_path = REPO_ROOT / "voices.json"
-    if voices_path.exists():
+
+async def handle_voices(request: StarletteRequest) -> Response:
+    global _voices_body
+    try:
+        mtime = VOICES_PATH.stat().st_mtime_ns
+    except OSError:
+        return Response(b"[]", media_type="application/json")
+    if _voices_body is None or _voices_body[0] != mtime:
         try:
-            data = json.loads(voices_path.read_text())
-            return JSONResponse(data)
-        except json.JSONDecodeError:
-            pass
-    return JSONResponse([])
+            body = orjson.dumps(orjson.loads(VOICES_PATH.read_bytes()))
+        except (OSError, orjson.JSONDecodeError):
+            body = b"[]"
+        _voices_body = (mtime, body)
+    return Response(_voices_body[1], media_type="application/json")
 
 
-async def handle_portrait(request: StarletteRequest) -> FileResponse | HTMLResponse:
-    name = request.path_params["name"]
-    portraits_root = (DASHBOARD_DIR / "portraits").resolve()
-    portrait_path = (portraits_root / name).resolve()
+# (directory mtime_ns, filenames) of the portraits dir, rescanned when it changes
+_portrait_names: tuple[int, frozenset[str]] | None = None
+
+_PORTRAIT_MEDIA = {
+    ".png": "image/png", ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg", ".webp": "image/webp",
+}
+
+
+def _portrait_listing() -> frozenset[str]:
+    global _portrait_names
     try:
-        portrait_path.relative_to(portraits_root)
-    except ValueError:
-        return HTMLResponse("Not found", status_code=404)
-
-    if portrait_path.exists() and portrait_path.is_file():
-        suffix = portrait_path.suffix.lower()
-        media = {
-            ".png": "image/png", ".jpg": "image/jpeg",
-            ".jpeg": "image/jpeg", ".webp": "image/webp",
-        }.get(suffix, "application/octet-stream")
-        return FileResponse(portrait_path, media_type=media)
+        mtime = PORTRAITS_ROOT.stat().st_mtime_ns
+        if _portrait_names is None or _portrait_names[0] != mtime:
+            with os.scandir(PORTRAITS_ROOT) as it:
+                _portrait_names = (mtime, frozenset(e.name for e in it if e.is_file(follow_symlinks=False)))
+    except OSError:
+        return frozenset()
+    return _portrait_names[1]
+
+
+async def handle_portrait(request: StarletteRequest) -> Response:
+    # Only regular files listed in the directory are served: no path or symlink escapes it
+    name = request.path_params["name"]
+    if name in _portrait_listing():
+        media = _PORTRAIT_MEDIA.get(os.path.splitext(name)[1].lower(), "application/octet-stream")
+        response = _serve_file(request, PORTRAITS_ROOT / name, media, "public, max-age=3600")
+        if response:
+            return response
     return HTMLResponse("Not found", status_code=404)
 
 
@@ -1104,22 +1869,26 @@ async def handle_portrait(request: StarletteRequest) -> FileResponse | HTMLRespo
 
 async def main():
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    _clean_old_cache(CACHE_DIR)
 
     async def _periodic_cache_cleanup():
+        # First pass runs in the background too, so a large cache doesn't delay startup
         while True:
-            await asyncio.sleep(3600)
             try:
                 await asyncio.to_thread(_clean_old_cache, CACHE_DIR)
+                await asyncio.to_thread(_clean_old_cache, TTS_CACHE_DIR, TTS_CACHE_MAX_AGE_HOURS)
             except Exception as e:
                 log.warning(f"Cache cleanup error: {e}")
+            await asyncio.sleep(3600)
 
     broadcaster = SSEBroadcaster()
     queue = AudioQueue(broadcaster)
     queue.start()
     asyncio.create_task(_periodic_cache_cleanup())
 
-    app = Starlette(middleware=[Middleware(LocalhostGuardMiddleware)], routes=[
+    app = Starlette(middleware=[
+        Middleware(RequestMetricsMiddleware),
+        Middleware(LocalhostGuardMiddleware),
+    ], routes=[
         Route("/speak", handle_speak, methods=["POST"]),
         Route("/speak/dialogue", handle_speak_dialogue, methods=["POST"]),
         Route("/queue", handle_queue_status, methods=["GET"]),
@@ -1138,14 +1907,30 @@ async def main():
     ])
     app.state.queue = queue
     app.state.broadcaster = broadcaster
+    app.state.metrics = {}
+
+    # uvicorn only configures its own loggers; give ours a handler so the
+    # daemon's info lines (request summaries included) reach stderr
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(levelname)s:     %(message)s"))
+    log.addHandler(handler)
+    log.setLevel(logging.INFO)
 
     config = uvicorn.Config(
         app, host="127.0.0.1", port=DASHBOARD_PORT,
-        log_level="info",
+        log_level="warning",
+        http="httptools", interface="asgi3",
+        access_log=False, timeout_keep_alive=30,
     )
     server = uvicorn.Server(config)
-    await server.serve()
+    _http_client()
+    try:
+        await server.serve()
+    finally:
+        if _http is not None:
+            await _http.aclose()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvicorn's loop setting only applies to uvicorn.run(); we own the loop here
+    asyncio.run(main(), loop_factory=uvloop.new_event_loop if uvloop else None)
@@ -90,7 +90,7 @@ struct VoiceActiveEvent: Codable {
     let totalDuration: Double?
     let offset: Double?
     let segments: [DialogueSegment]?
-    let envelope: [Float]?
+    let envelopeB64: String?
     let chunkMs: Int?
     let queued: Int?
     let channel: String?
@@ -99,10 +99,17 @@ struct VoiceActiveEvent: Codable {
     enum CodingKeys: String, CodingKey {
         case id, voice, type, text, duration
         case totalDuration = "total_duration"
-        case offset, segments, envelope
+        case offset, segments
+        case envelopeB64 = "envelope_b64"
         case chunkMs = "chunk_ms"
         case queued, channel, priority
     }
+
+    /// Lip-sync levels, sent as base64 uint8 (0-255) per chunk.
+    var envelope: [Float]? {
+        guard let b64 = envelopeB64, let bytes = Data(base64Encoded: b64) else { return nil }
+        return bytes.map { Float($0) / 255 }
+    }
 }
 
 struct DialogueSegment: Codable {
@@ -10,16 +10,15 @@ Environment variables (via .env file or shell environment):
 """
 
 import argparse
-import glob
+import http.client
 import json
 import os
 from pathlib import Path
 import subprocess
 import sys
 import tempfile
+import threading
 import time
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 
@@ -40,7 +39,7 @@ def _load_dotenv():
 
 _load_dotenv()
 
-API_BASE = "https://api.elevenlabs.io/v1"
+API_HOST = "api.elevenlabs.io"
 DEFAULT_MODEL = "eleven_v3"
 DEFAULT_FORMAT = "mp3_44100_128"
 TEMP_PREFIX = "claude-tts-"
@@ -93,24 +92,39 @@ def resolve_voice_id(voice):
 
 def cleanup_old_temp_files():
     """Remove TTS temp files older than 1 hour."""
-    pattern = os.path.join(tempfile.gettempdir(), f"{TEMP_PREFIX}*.mp3")
     cutoff = time.time() - 3600
-    for f in glob.glob(pattern):
-        try:
-            if os.path.getmtime(f) < cutoff:
-                os.unlink(f)
-        except OSError:
-            pass
+    with os.scandir(tempfile.gettempdir()) as it:
+        for entry in it:
+            if not entry.name.startswith(TEMP_PREFIX) or not entry.name.endswith(".mp3"):
+                continue
+            try:
+                if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except OSError:
+                pass
+
+
+def _api_request(method, path, api_key, payload=None):
+    body = json.dumps(payload).encode() if payload is not None else None
+    headers = {"xi-api-key": api_key}
+    if body is not None:
+        headers["Content-Type"] = "application/json"
+    conn = http.client.HTTPSConnection(API_HOST, timeout=120)
+    conn.request(method, path, body=body, headers=headers)
+    return conn.getresponse()
 
 
 def list_voices(api_key):
-    req = Request(f"{API_BASE}/voices", headers={"xi-api-key": api_key})
     try:
-        with urlopen(req) as resp:
-            data = json.loads(resp.read())
-    except HTTPError as e:
-        print(f"Error: {e.code} {e.reason}", file=sys.stderr)
+        resp = _api_request("GET", "/v1/voices", api_key)
+        raw = resp.read()
+    except (OSError, http.client.HTTPException) as e:
+        print(f"Network error: {e}", file=sys.stderr)
         sys.exit(1)
+    if resp.status != 200:
+        print(f"Error: {resp.status} {resp.reason}", file=sys.stderr)
+        sys.exit(1)
+    data = json.loads(raw)
 
     voices = data.get("voices", [])
     print(f"{'Voice ID':<28} {'Name':<20} {'Category':<15} {'Labels'}")
@@ -122,46 +136,47 @@ def list_voices(api_key):
 
 
 def speak_elevenlabs(text, api_key, voice_id, model=DEFAULT_MODEL, sync=False):
-    url = f"{API_BASE}/text-to-speech/{voice_id}"
-    payload = json.dumps({
+    payload = {
         "text": text,
         "model_id": model,
         "output_format": DEFAULT_FORMAT,
-    }).encode()
-
-    req = Request(url, data=payload, headers={
-        "xi-api-key": api_key,
-        "Content-Type": "application/json",
-    })
+    }
 
+    fd, tmp_path = tempfile.mkstemp(prefix=TEMP_PREFIX, suffix=".mp3")
     try:
-        with urlopen(req) as resp:
-            audio_data = resp.read()
-    except HTTPError as e:
-        body = ""
+        with os.fdopen(fd, "wb") as f:
+            resp = _api_request("POST", f"/v1/text-to-speech/{voice_id}", api_key, payload)
+            if resp.status != 200:
+                body = resp.read().decode(errors="replace")
+                print(f"ElevenLabs API error {resp.status}: {body}", file=sys.stderr)
+                os.unlink(tmp_path)
+                return False
+            # Stream straight to disk through one reused buffer: constant memory
+            # however long the clip, no per-chunk allocation
+            buf = memoryview(bytearray(65536))
+            while n := resp.readinto(buf):
+                f.write(buf[:n])
+    except (OSError, http.client.HTTPException) as e:
         try:
-            body = e.read().decode()
-        except Exception:
+            os.unlink(tmp_path)
+        except OSError:
             pass
-        print(f"ElevenLabs API error {e.code}: {body}", file=sys.stderr)
-        return False
-    except URLError as e:
-        print(f"Network error: {e.reason}", file=sys.stderr)
+        print(f"Network error: {e}", file=sys.stderr)
         return False
 
-    fd, tmp_path = tempfile.mkstemp(prefix=TEMP_PREFIX, suffix=".mp3")
-    with os.fdopen(fd, "wb") as f:
-        f.write(audio_data)
-
     if sync:
         try:
             subprocess.run(["afplay", tmp_path], check=True)
         finally:
-            os.unlink(tmp_path)
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
     else:
-        # Detached: afplay runs after script exits, temp file cleaned up later
+        # Detached: afplay outlives this script, so the same session removes the
+        # file once playback ends instead of leaving it for the hourly sweep
         subprocess.Popen(
-            ["afplay", tmp_path],
+            ["/bin/sh", "-c", 'afplay "$1"; rm -f "$1"', "speak", tmp_path],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
             start_new_session=True,
@@ -183,7 +198,8 @@ def speak_macos(text, sync=False):
 
 
 def speak(text, voice_id=None, model=DEFAULT_MODEL, sync=False):
-    cleanup_old_temp_files()
+    # Off the path to audio; a sweep cut short by exit just resumes next run
+    threading.Thread(target=cleanup_old_temp_files, daemon=True).start()
 
     config = get_config()
     api_key = config["api_key"]
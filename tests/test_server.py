@@ -0,0 +1,66 @@
+"""Regression tests for daemon/server.py. Run with: python -m unittest discover tests"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+os.environ["SPEAK_CACHE_DIR"] = tempfile.mkdtemp(prefix="speak-test-cache-")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "daemon"))
+
+import server  # noqa: E402
+
+
+class TTSCacheTest(unittest.IsolatedAsyncioTestCase):
+    async def test_hit_on_old_slot_survives_cache_cleanup(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            slot = Path(tmp) / "slot.mp3"
+            slot.write_bytes(b"ID3" + b"\0" * 64)
+            old = time.time() - 48 * 3600
+            os.utime(slot, (old, old))
+
+            path = server._cached_tts(slot)
+            self.assertIsNotNone(path)
+            cache_dir = Path(tmp) / "cache"
+            cache_dir.mkdir()
+            replay = cache_dir / "entry.mp3"
+            try:
+                await server._link_or_copy(path, replay)
+                server._clean_old_cache(cache_dir)
+                self.assertTrue(replay.exists())
+            finally:
+                os.unlink(path)
+
+
+class StreamingPlaybackTest(unittest.IsolatedAsyncioTestCase):
+    async def test_download_failed_before_pickup_is_not_played(self):
+        fd, path = tempfile.mkstemp(prefix=server.TEMP_PREFIX, suffix=".mp3")
+        with os.fdopen(fd, "wb") as f:
+            f.write(b"ID3" + b"\0" * 100_000)
+
+        async def _download():
+            raise ValueError("connection dropped mid-stream")
+
+        queue = server.AudioQueue(server.SSEBroadcaster())
+        entry = server.QueueEntry(
+            id="truncated", audio_path=path, text_preview="hi",
+            voice_label="V", created_at=time.time(),
+        )
+        entry.download = asyncio.create_task(_download())
+        await asyncio.wait({entry.download})
+        queue.enqueue(entry)
+        queue.start()
+        for _ in range(100):
+            if queue.get_history():
+                break
+            await asyncio.sleep(0.01)
+
+        self.assertTrue(queue.get_history()[0]["failed"])
+        self.assertFalse((queue._cache_dir / "truncated.mp3").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()